@@ -2,6 +2,8 @@ from natal import const
 from natal.stats import Stats
 from typing import Literal
 
+QUADRANT_NAMES = ("first", "second", "third", "fourth")
+
 
 class AIContext(Stats):
     """statistics data in markdown format for AI context"""
@@ -24,24 +26,23 @@ class AIContext(Stats):
 
     def quadrants(self):
         """distribution of celestial bodies in the 4 quadrants"""
-        quadrant_names = ["first", "second", "third", "fourth"]
         grid = [["quadrants", "celestial bodies", "sum"]]
-        for i, q in enumerate(self.data1.quadrants):
-            grid.append([quadrant_names[i], ", ".join([b.symbol for b in q]), len(q)])
+        for name, q in zip(QUADRANT_NAMES, self.data1.quadrants):
+            grid.append([name, ", ".join(b.symbol for b in q), len(q)])
         return grid
 
     def hemispheres(self):
         """distribution of celestial bodies in the 4 hemispheres"""
         q = self.data1.quadrants
+        hemispheres = {
+            "southern": q[2] + q[3],
+            "northern": q[0] + q[1],
+            "eastern": q[0] + q[3],
+            "western": q[1] + q[2],
+        }
         grid = [["hemispheres", "celestial bodies", "sum"]]
-        southern_sum = len(q[3] + q[2])
-        northern_sum = len(q[0] + q[1])
-        eastern_sum = len(q[3] + q[0])
-        western_sum = len(q[1] + q[2])
-        grid.append(["southern", ", ".join([b.symbol for b in q[2] + q[3]]), southern_sum])
-        grid.append(["northern", ", ".join([b.symbol for b in q[0] + q[1]]), northern_sum])
-        grid.append(["eastern", ", ".join([b.symbol for b in q[0] + q[3]]), eastern_sum])
-        grid.append(["western", ", ".join([b.symbol for b in q[1] + q[2]]), western_sum])
+        for name, bodies in hemispheres.items():
+            grid.append([name, ", ".join(b.symbol for b in bodies), len(bodies)])
         return grid
 
     def aspects(self):
@@ -54,36 +55,32 @@ class AIContext(Stats):
                 "aspect",
             ]
         grid = [headers]
-        for asp in self.aspect_pairs():
-            grid.append([asp.body1.symbol, asp.body2.symbol, asp.aspect_member.name])
+        grid.extend(
+            [asp.body1.symbol, asp.body2.symbol, asp.aspect_member.name]
+            for asp in self.aspect_pairs()
+        )
         return grid
 
     def markdown(self, title: str, grid: list[list]) -> str:
         """markdown of specific function's grid data for AI context"""
-        output = f"#### {title}\n"
         header = grid.pop(0)
-        output += "|"
-        for item in header:
-            output += f"{item} | "
-        output += "\n"
-        output += "|" + "--- | " * len(header)
-        output += "\n"
+        parts = [f"#### {title}\n|"]
+        parts.extend(f"{item} | " for item in header)
+        parts.append("\n|" + "--- | " * len(header) + "\n")
         for row in grid:
-            output += "|"
-            for item in row:
-                output += f"{item} | "
-            output += "\n"
-        output += "\n"
-        return output
+            parts.append("|")
+            parts.extend(f"{item} | " for item in row)
+            parts.append("\n")
+        parts.append("\n")
+        return "".join(parts)
 
     def distribution(self, kind: Literal["element", "modality", "polarity"]) -> list[list]:
         """distribution of celestial bodies based on kind"""
         names = getattr(const, f"{kind}_NAMES".upper())
+        buckets = {name: [] for name in names}
+        for body in self.data1.aspectables:
+            buckets[body.sign[kind]].append(body.symbol)
         grid = [[kind, "celestial bodies", "sum"]]
-        for name in names:
-            bodies = []
-            for body in self.data1.aspectables:
-                if body.sign[kind] == name:
-                    bodies.append(body.symbol)
+        for name, bodies in buckets.items():
             grid.append([name, ", ".join(bodies), len(bodies)])
         return grid
@@ -4,22 +4,110 @@ It includes functionality for creating sign wheels, house wheels, body placement
 and aspect lines for both single and composite charts.
 """
 
-from functools import cached_property
-from math import cos, radians, sin
+from functools import cache, cached_property, lru_cache
+from itertools import chain
+from math import cos, pi, sin
 from natal.classes import Aspect
 from natal.config import DotDict
-from natal.const import SIGN_MEMBERS, VERTEX_NAMES
+from natal.const import (
+    ASPECT_MEMBERS,
+    EXTRA_NAMES,
+    PLANET_NAMES,
+    SIGN_MEMBERS,
+    SIGN_NAMES,
+    VERTEX_NAMES,
+)
 from natal.data import Data
-from pathlib import Path
-from tagit import circle, g, line, path, svg, text
+from natal.utils import svg_folder, svg_path_data
+from operator import itemgetter
+from tagit import circle, defs, g, line, path, svg, symbol, text, use
+from typing import Iterable
 
 
-def _svg_paths() -> dict:
-    folder = Path(__file__).parent.absolute() / "svg_paths"
-    return {svg.stem: svg.read_text() for svg in folder.glob("*.svg")}
+@cache
+def svg_symbol(name: str) -> str:
+    """SVG symbol of a sign or body, loaded on first use and referenced with <use>."""
+    return symbol(svg_path_data(name), id=f"sym_{name}", overflow="visible")
 
 
-svg_paths = _svg_paths()
+def __getattr__(name: str) -> dict[str, str]:
+    """Build the legacy `svg_paths` mapping on first access, kept for compatibility."""
+    if name == "svg_paths":
+        files = (f.name for f in svg_folder.iterdir() if f.name.endswith(".svg"))
+        stems = (file.removesuffix(".svg") for file in files)
+        paths = {stem: svg_path_data(stem) for stem in stems}
+        globals()["svg_paths"] = paths
+        return paths
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+symbol_refs = {
+    name: f"#sym_{name}" for name in chain(SIGN_NAMES, PLANET_NAMES, EXTRA_NAMES, VERTEX_NAMES)
+}
+
+
+DEG2RAD = pi / 180
+# aspect line opacities are quantized so similar lines merge into one path
+OPACITY_LEVELS = 16
+# houses starting at asc, ic, dsc and mc, drawn with long vertex lines
+ANGULAR_HOUSES = frozenset({1, 4, 7, 10})
+
+
+def unit_vector(degree: float) -> tuple[float, float]:
+    """Cosine and sine of an angle given in degrees."""
+    angle = degree * DEG2RAD
+    return cos(angle), sin(angle)
+
+
+def rotate(trig: tuple[float, float], offset: tuple[float, float]) -> tuple[float, float]:
+    """Cosine and sine of the sum of two angles, given the trig of each."""
+    cos_a, sin_a = trig
+    cos_b, sin_b = offset
+    return cos_a * cos_b - sin_a * sin_b, sin_a * cos_b + cos_a * sin_b
+
+
+# signs are fixed 30 degree sectors, only their rotation to the asc varies per chart
+SIGN_TRIG = tuple(unit_vector(i * 30) for i in range(12))
+SIGN_CENTER_TRIG = tuple(unit_vector(i * 30 + 15) for i in range(12))
+
+
+def symbol_transform(x: float, y: float, scale: float, precision: int) -> str:
+    """SVG transform placing a symbol at (x, y) with the given scale."""
+    return f"translate({x:.{precision}f}, {y:.{precision}f}) scale({scale:.3f})"
+
+
+@lru_cache(maxsize=32)
+def background_circle(cx: float, cy: float, radius: float, **attrs) -> str:
+    """Ring background circle, shared by charts of the same size and theme."""
+    return circle(cx=cx, cy=cy, r=radius, **attrs)
+
+
+def spread_degrees(degrees: Iterable[float], min_degree: float) -> list[float]:
+    """Push sorted degrees forward until each clears its predecessor by min_degree.
+
+    Args:
+        degrees: Sorted normalized degrees of celestial bodies
+        min_degree: Minimum allowed degree separation
+
+    Returns:
+        A new list of forward-adjusted degrees
+    """
+    step = min_degree + 0.1  # prevent overlap for float precision
+    degs = list(degrees)
+    n = len(degs)
+    changed = True
+    while changed:
+        changed = False
+        # the wrap-around neighbour is hoisted out of the sweep
+        prev_deg = degs[-1] - 360
+        for i in range(n):
+            deg = degs[i]
+            delta = deg - prev_deg
+            if deg < prev_deg or delta < min_degree or 360 - delta < min_degree:
+                deg = degs[i] = prev_deg + step
+                changed = True
+            prev_deg = deg
+    return degs
 
 
 class Chart(DotDict):
@@ -58,23 +146,35 @@ class Chart(DotDict):
         self.cy = self.height / 2
 
         self.config = self.data1.config
+        self.precision = self.config.chart.precision
+        # ndigits for round(), None rounds to int and drops the decimal point
+        self.ndigits = self.precision or None
+        # every sector path starts with a move to the chart center
+        self.path_origin = f"M{self.cx:.{self.precision}f} {self.cy:.{self.precision}f}"
         margin = min(self.width, self.height) * self.config.chart.margin_factor
         self.max_radius = min(self.width - margin, self.height - margin) // 2
         self.margin = margin
         self.ring_thickness = self.max_radius * self.config.chart.ring_thickness_fraction
         self.font_size = self.ring_thickness * self.config.chart.font_size_fraction
+        # radii of the nested rings, from the house ring inwards
+        self.house_radius = self.max_radius - self.ring_thickness
+        self.cusp_radius = self.max_radius - 2 * self.ring_thickness
+        self.outer_body_radius = self.max_radius - 3 * self.ring_thickness
+        self.inner_body_radius = self.max_radius - 4 * self.ring_thickness
         self.scale_adjustment = self.width / self.config.chart.scale_adj_factor
         self.pos_adjustment = self.font_size / self.config.chart.pos_adj_factor
 
-    def svg_root(self, content: str | list[str]) -> str:
+    def svg_root(self, content: str | Iterable[str]) -> str:
         """Generate an SVG root element with sensible defaults.
 
         Args:
-            content: The content to be included in the SVG root
+            content: The content to be included in the SVG root, elements are joined in one pass
 
         Returns:
             An SVG root element as a string
         """
+        if not isinstance(content, str):
+            content = "".join(content)
         return svg(
             content,
             height=self.height,
@@ -108,22 +208,51 @@ class Chart(DotDict):
         Returns:
             An SVG path element representing the sector
         """
-        start_rad = radians(start_deg)
-        end_rad = radians(end_deg)
-        start_x = self.cx - radius * cos(start_rad)
-        start_y = self.cy + radius * sin(start_rad)
-        end_x = self.cx - radius * cos(end_rad)
-        end_y = self.cy + radius * sin(end_rad)
-
-        start_x, start_y, end_x, end_y = [round(val, 2) for val in (start_x, start_y, end_x, end_y)]
-
-        path_data = " ".join(
-            (
-                "M{} {}".format(self.cx, self.cy),
-                "L{} {}".format(start_x, start_y),
-                "A{} {} 0 0 0 {} {}".format(radius, radius, end_x, end_y),
-                "Z",
-            )
+        return self.trig_sector(
+            radius=radius,
+            start_trig=unit_vector(start_deg),
+            end_trig=unit_vector(end_deg),
+            fill=fill,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            stroke_opacity=stroke_opacity,
+        )
+
+    def trig_sector(
+        self,
+        radius: float,
+        start_trig: tuple[float, float],
+        end_trig: tuple[float, float],
+        fill: str = "white",
+        stroke_color: str = "black",
+        stroke_width: float = 1,
+        stroke_opacity: float = 1,
+    ) -> str:
+        """Create a sector shape from precomputed boundary trigonometry.
+
+        Args:
+            radius: Radius of the sector
+            start_trig: Cosine and sine of the starting angle
+            end_trig: Cosine and sine of the ending angle
+            fill: Fill color of the sector
+            stroke_color: Stroke color of the sector
+            stroke_width: Width of the stroke
+            stroke_opacity: Opacity of the stroke
+
+        Returns:
+            An SVG path element representing the sector
+        """
+        cx, cy = self.cx, self.cy
+        start_cos, start_sin = start_trig
+        end_cos, end_sin = end_trig
+        p = self.precision
+
+        # formatted straight to the chart precision, no intermediate rounding
+        path_data = (
+            f"{self.path_origin}"
+            f"L{cx - radius * start_cos:.{p}f} {cy + radius * start_sin:.{p}f}"
+            f"A{radius:.{p}f} {radius:.{p}f} 0 0 0 "
+            f"{cx - radius * end_cos:.{p}f} {cy + radius * end_sin:.{p}f}Z"
         )
         return path(
             "",
@@ -134,6 +263,20 @@ class Chart(DotDict):
             stroke_opacity=stroke_opacity,
         )
 
+    def point(self, radius: float, trig: tuple[float, float]) -> tuple[float, float]:
+        """Project an angle onto the chart at the given radius.
+
+        Args:
+            radius: Distance from the chart center
+            trig: Cosine and sine of the angle
+
+        Returns:
+            The x and y coordinates of the point, rounded to the chart precision
+        """
+        cos_a, sin_a = trig
+        ndigits = self.ndigits
+        return round(self.cx - radius * cos_a, ndigits), round(self.cy + radius * sin_a, ndigits)
+
     def background(self, radius: float, **kwargs) -> str:
         """Create a background circle for the chart.
 
@@ -144,7 +287,19 @@ class Chart(DotDict):
         Returns:
             An SVG circle element representing the background
         """
-        return circle(cx=self.cx, cy=self.cy, r=radius, **kwargs)
+        return background_circle(self.cx, self.cy, radius, **kwargs)
+
+    def symbol_defs(self) -> str:
+        """Define the sign and body symbols drawn on the chart.
+
+        Returns:
+            An SVG defs element holding one symbol per sign and body
+        """
+        names = [sign.name for sign in SIGN_MEMBERS]
+        for data in (self.data1, self.data2):
+            if data is not None:
+                names.extend(body.name for body in data.aspectables)
+        return defs([svg_symbol(name) for name in dict.fromkeys(names)])
 
     def sign_wheel(self) -> list[str]:
         """Generate the zodiac sign wheel.
@@ -153,19 +308,23 @@ class Chart(DotDict):
             A list of SVG elements representing the sign wheel
         """
         radius = self.max_radius
-
-        wheel = [self.background(radius=radius, fill=self.config.theme.background)]
+        theme = self.config.theme
+        foreground = theme.foreground
+        stroke_width = self.config.chart.stroke_width
+        sign_trig = self.sign_trig
+        bg_colors = self.bg_colors
+        sector = self.trig_sector
+
+        wheel = [self.background(radius=radius, fill=theme.background)]
         for i in range(12):
-            start_deg = self.data1.signs[i].normalized_degree
-            end_deg = start_deg + 30
             wheel.append(
-                self.sector(
+                sector(
                     radius=radius,
-                    start_deg=start_deg,
-                    end_deg=end_deg,
-                    fill=self.bg_colors[i],
-                    stroke_color=self.config.theme.foreground,
-                    stroke_width=self.config.chart.stroke_width,
+                    start_trig=sign_trig[i],
+                    end_trig=sign_trig[(i + 1) % 12],
+                    fill=bg_colors[i],
+                    stroke_color=foreground,
+                    stroke_width=stroke_width,
                 )
             )
         return wheel
@@ -176,34 +335,45 @@ class Chart(DotDict):
         Returns:
             A list of SVG elements representing the zodiac sign symbols
         """
-
-        wheel = []
-        for i in range(12):
-            start_deg = self.data1.signs[i].normalized_degree
-            symbol_radius = self.max_radius - (self.ring_thickness / 2)
-            symbol_angle = radians(start_deg + 15)  # Center of the sector
-            symbol_x = self.cx - symbol_radius * cos(symbol_angle) - self.pos_adjustment
-            symbol_y = self.cy + symbol_radius * sin(symbol_angle) - self.pos_adjustment
-            wheel.append(
-                g(
-                    [
-                        circle(
-                            cx=10,
-                            cy=10,
-                            r=12,
-                            stroke="none",
-                            # fill="red",
-                            fill=self.bg_colors[i],
-                        ),
-                        svg_paths[SIGN_MEMBERS[i].name],
-                    ],
-                    stroke=self.config.theme[SIGN_MEMBERS[i].color],
-                    stroke_width=self.config.chart.stroke_width * 1.5,
-                    fill="none",
-                    transform=f"translate({symbol_x}, {symbol_y}) scale({self.scale_adjustment})",
+        stroke_width = self.config.chart.stroke_width * 1.5
+        symbol_radius = self.max_radius - (self.ring_thickness / 2)
+        pos_adj = self.pos_adjustment
+        bg_colors = self.bg_colors
+
+        scale_adj = self.scale_adjustment
+        # the 20x20 symbol box is centered at (10, 10) before scaling
+        bg_offset = 10 * scale_adj
+        ndigits = self.ndigits
+        precision = self.precision
+        bg_radius = round(12 * scale_adj, ndigits)
+
+        sign_refs = [symbol_refs[sign.name] for sign in SIGN_MEMBERS]
+        sign_colors = self.sign_colors
+
+        point = self.point
+        symbols = []
+        for i, trig in enumerate(self.sign_center_trig):
+            symbol_x, symbol_y = point(symbol_radius, trig)
+            symbol_x -= pos_adj
+            symbol_y -= pos_adj
+            symbols.append(
+                circle(
+                    cx=round(symbol_x + bg_offset, ndigits),
+                    cy=round(symbol_y + bg_offset, ndigits),
+                    r=bg_radius,
+                    stroke="none",
+                    # fill="red",
+                    fill=bg_colors[i],
                 )
             )
-        return wheel
+            symbols.append(
+                use(
+                    href=sign_refs[i],
+                    stroke=sign_colors[i],
+                    transform=symbol_transform(symbol_x, symbol_y, scale_adj, precision),
+                )
+            )
+        return [g(symbols, stroke_width=stroke_width, fill="none")]
 
     def house_wheel(self) -> list[str]:
         """Generate the house wheel.
@@ -211,35 +381,40 @@ class Chart(DotDict):
         Returns:
             A list of SVG elements representing the house wheel
         """
-        radius = self.max_radius - self.ring_thickness
-        wheel = [self.background(radius, fill=self.config.theme.background)]
+        radius = self.house_radius
+        theme = self.config.theme
+        foreground = theme.foreground
+        stroke_width = self.config.chart.stroke_width
+        house_trig = self.house_trig
+        house_mid_trig = self.house_mid_trig
+        bg_colors = self.bg_colors
+        number_colors = self.sign_colors
+        number_width = self.font_size * 0.8
+        number_radius = radius - (self.ring_thickness / 2)
+        sector = self.trig_sector
+        point = self.point
+        wheel = [self.background(radius, fill=theme.background)]
 
-        for i, (start_deg, end_deg) in enumerate(self.house_vertices):
+        for i in range(12):
             wheel.append(
-                self.sector(
+                sector(
                     radius=radius,
-                    start_deg=start_deg,
-                    end_deg=end_deg,
-                    fill=self.bg_colors[i],
-                    stroke_color=self.config.theme.foreground,
-                    stroke_width=self.config.chart.stroke_width,
+                    start_trig=house_trig[i],
+                    end_trig=house_trig[(i + 1) % 12],
+                    fill=bg_colors[i],
+                    stroke_color=foreground,
+                    stroke_width=stroke_width,
                 )
             )
 
-            # Add house number
-            number_width = self.font_size * 0.8
-            number_radius = radius - (self.ring_thickness / 2)
-            number_angle = radians(
-                start_deg + ((end_deg - start_deg) % 360) / 2
-            )  # Center of the house
-            number_x = self.cx - number_radius * cos(number_angle)
-            number_y = self.cy + number_radius * sin(number_angle)
+            # Add house number at the center of the house
+            number_x, number_y = point(number_radius, house_mid_trig[i])
             wheel.append(
                 text(
                     str(i + 1),  # House numbers start from 1
                     x=number_x,
                     y=number_y,
-                    fill=getattr(self.config.theme, SIGN_MEMBERS[i].color),
+                    fill=number_colors[i],
                     font_size=number_width,
                     text_anchor="middle",
                     dominant_baseline="central",
@@ -255,45 +430,49 @@ class Chart(DotDict):
             A list of SVG elements representing vertex lines
         """
         vertex_radius = self.max_radius + self.margin // 2
-        house_radius = self.max_radius - 2 * self.ring_thickness
-        body_radius = self.max_radius - 3 * self.ring_thickness
+        house_radius = self.cusp_radius
+        body_radius = self.outer_body_radius
+        theme = self.config.theme
+        foreground = theme.foreground
+        dim = theme.dim
+        stroke_width = self.config.chart.stroke_width
+        stroke_opacity = self.config.chart.stroke_opacity
 
         lines = [
             self.background(
                 house_radius,
-                fill=self.config.theme.background,
-                stroke=self.config.theme.foreground,
-                stroke_width=self.config.chart.stroke_width,
+                fill=theme.background,
+                stroke=foreground,
+                stroke_width=stroke_width,
             ),
             self.background(
                 body_radius,
                 fill="#88888800",  # transparent
-                stroke=self.config.theme.dim,
-                stroke_width=self.config.chart.stroke_width,
+                stroke=dim,
+                stroke_width=stroke_width,
             ),
         ]
-        for house in self.data1.houses:
+        cx, cy = self.cx, self.cy
+        point = self.point
+        for house, trig in zip(self.data1.houses, self.house_trig):
             radius = house_radius
-            stroke_width = self.config.chart.stroke_width
-            stroke_color = self.config.theme.dim
+            stroke_color = dim
 
-            if house.value in [1, 4, 7, 10]:
+            if house.value in ANGULAR_HOUSES:
                 radius = vertex_radius
-                stroke_color = self.config.theme.foreground
+                stroke_color = foreground
 
-            angle = radians(house.normalized_degree)
-            end_x = self.cx - radius * cos(angle)
-            end_y = self.cy + radius * sin(angle)
+            end_x, end_y = point(radius, trig)
 
             lines.append(
                 line(
-                    x1=self.cx,
-                    y1=self.cy,
+                    x1=cx,
+                    y1=cy,
                     x2=end_x,
                     y2=end_y,
                     stroke=stroke_color,
                     stroke_width=stroke_width,
-                    stroke_opacity=self.config.chart.stroke_opacity,
+                    stroke_opacity=stroke_opacity,
                 )
             )
 
@@ -305,21 +484,20 @@ class Chart(DotDict):
         Returns:
             A list of SVG elements representing the outer body wheel
         """
-        radius = self.max_radius - 3 * self.ring_thickness
-        data = self.data2 or self.data1
-        return self.body_wheel(radius, data, self.config.chart.outer_min_degree)
+        data = self.data1 if self.data2 is None else self.data2
+        return self.body_wheel(self.outer_body_radius, data, self.config.chart.outer_min_degree)
 
-    def inner_body_wheel(self) -> list[str] | None:
+    def inner_body_wheel(self) -> list[str]:
         """Generate the inner body wheel for composite charts.
 
         Returns:
-            A list of SVG elements representing the inner body wheel, or None for single charts
+            A list of SVG elements representing the inner body wheel, empty for single charts
         """
         if self.data2 is None:
-            return
-        radius = self.max_radius - 4 * self.ring_thickness
-        data = self.data1
-        return self.body_wheel(radius, data, self.config.chart.inner_min_degree)
+            return []
+        return self.body_wheel(
+            self.inner_body_radius, self.data1, self.config.chart.inner_min_degree
+        )
 
     def outer_aspect(self) -> list[str]:
         """Generate aspect lines for the outer wheel in single charts.
@@ -329,7 +507,7 @@ class Chart(DotDict):
         """
         if self.data2 is not None:
             return []
-        radius = self.max_radius - 3 * self.ring_thickness
+        radius = self.outer_body_radius
         aspects = self.data1.aspects
         return self.aspect_lines(radius, aspects)
 
@@ -341,29 +519,35 @@ class Chart(DotDict):
         """
         if self.data2 is None:
             return []
-        radius = self.max_radius - 4 * self.ring_thickness
+        radius = self.inner_body_radius
         aspects = self.data1.calculate_aspects(self.data1.composite_aspect_pairs(self.data2))
         return self.aspect_lines(radius, aspects)
 
-    @property
+    @cached_property
     def svg(self) -> str:
         """Generate the SVG representation of the chart.
 
+        The chart is rendered once on first access, create a new Chart
+        if the underlying data changes.
+
         Returns:
             str: SVG content.
         """
-        return self.svg_root(
-            [
-                self.sign_wheel(),
-                self.house_wheel(),
-                self.vertex_wheel(),
-                self.sign_wheel_symbols(),
-                self.outer_body_wheel(),
-                self.inner_body_wheel(),
-                self.outer_aspect(),
-                self.inner_aspect(),
-            ]
-        )
+        wheels = [
+            [self.symbol_defs()],
+            self.sign_wheel(),
+            self.house_wheel(),
+            self.vertex_wheel(),
+            self.sign_wheel_symbols(),
+            self.outer_body_wheel(),
+        ]
+        # composite charts draw the aspects inside the inner body wheel
+        if self.data2 is None:
+            wheels.append(self.outer_aspect())
+        else:
+            wheels.append(self.inner_body_wheel())
+            wheels.append(self.inner_aspect())
+        return self.svg_root(chain.from_iterable(wheels))
 
     # utils ======================================================
 
@@ -377,48 +561,27 @@ class Chart(DotDict):
         Returns:
             Adjusted degrees of celestial bodies
         """
-        step = min_degree + 0.1  # prevent overlap for float precision
-        n = len(degrees)
-
-        fwd_degs = degrees.copy()
-        bwd_degs = degrees[::-1]
-
-        # Forward adjustment
-        changed = True
-        while changed:
-            changed = False
-            for i in range(n):
-                prev_deg = fwd_degs[-1] - 360 if i == 0 else fwd_degs[i - 1]
-                delta = fwd_degs[i] - prev_deg
-                diff = min(delta, 360 - delta)
-                if (fwd_degs[i] < prev_deg) or (diff < min_degree):
-                    fwd_degs[i] = prev_deg + step
-                    changed = True
-
-        # Backward adjustment
-        changed = True
-        while changed:
-            changed = False
-            for i in range(n):
-                prev_deg = bwd_degs[-1] + 360 if i == 0 else bwd_degs[i - 1]
-                delta = prev_deg - bwd_degs[i]
-                diff = min(delta, 360 - delta)
-                if (prev_deg < bwd_degs[i]) or (diff < min_degree):
-                    bwd_degs[i] = prev_deg - step
-                    changed = True
-
-        bwd_degs.reverse()
-
-        # average forward and backward adjustments
+        if not degrees:
+            return []
+
+        # nothing to spread when every gap around the circle is wide enough
+        gaps = [b - a for a, b in zip(degrees, degrees[1:])]
+        gaps.append(degrees[0] + 360 - degrees[-1])
+        if min(gaps) >= min_degree:
+            return list(degrees)
+
+        fwd_degs = spread_degrees(degrees, min_degree)
+        # the backward sweep is the forward sweep over the mirrored circle,
+        # read back in reverse and negated while averaging
+        mirrored = spread_degrees((-deg for deg in reversed(degrees)), min_degree)
+
+        # average forward and backward adjustments, across 0° when they are
+        # 180° or more apart
         avg_adj = []
-        for fwd, bwd in zip(fwd_degs, bwd_degs):
+        for fwd, neg_bwd in zip(fwd_degs, reversed(mirrored)):
             fwd %= 360
-            bwd %= 360
-            if abs(fwd - bwd) < 180:
-                avg = (fwd + bwd) / 2
-            else:
-                avg = ((fwd + bwd + 360) / 2) % 360
-            avg_adj.append(avg)
+            bwd = -neg_bwd % 360
+            avg_adj.append(((fwd + bwd + 360 * (abs(fwd - bwd) >= 180)) / 2) % 360)
 
         return avg_adj
 
@@ -433,12 +596,13 @@ class Chart(DotDict):
         Returns:
             A list of SVG elements representing the body wheel
         """
-
-        def norm_deg(x):
-            return self.data1.normalize(x.degree)
-
-        sorted_norm_bodies = sorted(data.aspectables, key=norm_deg)
-        sorted_norm_degs = [norm_deg(b) for b in sorted_norm_bodies]
+        # normalize each body once, relative to the primary chart
+        norm_bodies = sorted(
+            ((self.data1.normalize(body.degree), body) for body in data.aspectables),
+            key=itemgetter(0),
+        )
+        sorted_norm_degs = [deg for deg, _ in norm_bodies]
+        sorted_norm_bodies = [body for _, body in norm_bodies]
 
         # Calculate adjusted positions
         adj_norm_degs = (
@@ -449,69 +613,79 @@ class Chart(DotDict):
         # for tests only
         self.adj_degs_len = len(adj_norm_degs)
 
-        output = []
-        for body, adj_deg in zip(sorted_norm_bodies, adj_norm_degs):
+        theme = self.config.theme
+        theme_colors = self.theme_colors
+        background = theme.background
+        dim = theme.dim
+        stroke_width = self.config.chart.stroke_width
+        symbol_stroke_width = stroke_width * 1.5
+        line_stroke_width = stroke_width / 2
+        symbol_radius = wheel_radius + (self.ring_thickness / 2)
+        inner_radius = wheel_radius - self.ring_thickness
+        symbol_bg_radius = self.font_size / 2
+        dasharray = self.ring_thickness / 11
+        pos_adj = self.pos_adjustment
+        scale_adj = self.scale_adjustment
+        precision = self.precision
+
+        # project every body up front, the loop below only emits elements
+        point = self.point
+        original_trigs = [unit_vector(deg) for deg in sorted_norm_degs]
+        # original angle for the line start and the inner circle
+        degree_points = [point(wheel_radius, trig) for trig in original_trigs]
+        inner_points = [point(inner_radius, trig) for trig in original_trigs]
+        # adjusted angle for the symbol position
+        symbol_points = [point(symbol_radius, unit_vector(deg)) for deg in adj_norm_degs]
+
+        body_count = len(sorted_norm_bodies)
+        if not body_count:
+            return []
+        # dashed ticks share their style through one group
+        ticks = [""] * body_count
+        # the tick group goes first, then three elements per body
+        output = [""] * (3 * body_count + 1)
+        placements = zip(sorted_norm_bodies, degree_points, symbol_points, inner_points)
+        for i, (body, (degree_x, degree_y), (symbol_x, symbol_y), (inner_x, inner_y)) in enumerate(
+            placements
+        ):
+            body_color = theme_colors[body.color]
             g_opt = {
                 "fill": "none",
-                "stroke": self.config.theme[body.color],
-                "stroke_width": self.config.chart.stroke_width * 1.5,
+                "stroke": body_color,
+                "stroke_width": symbol_stroke_width,
             }
 
             # special handling for asc, ic, dsc and mc
             if body.name in VERTEX_NAMES:
-                g_opt["fill"] = self.config.theme[body.color]
+                g_opt["fill"] = body_color
                 g_opt["stroke"] = "none"
 
-            symbol_radius = wheel_radius + (self.ring_thickness / 2)
-
-            # Use original angle for line start position
-            original_angle = radians(self.data1.normalize(body.degree))
-            degree_x = self.cx - wheel_radius * cos(original_angle)
-            degree_y = self.cy + wheel_radius * sin(original_angle)
-
-            # Use adjusted angle for symbol position
-            adjusted_angle = radians(adj_deg)
-            symbol_x = self.cx - symbol_radius * cos(adjusted_angle)
-            symbol_y = self.cy + symbol_radius * sin(adjusted_angle)
-
-            # Add line connecting to the inner circle
-            inner_radius = wheel_radius - self.ring_thickness
-            inner_x = self.cx - inner_radius * cos(original_angle)
-            inner_y = self.cy + inner_radius * sin(original_angle)
-
-            output.extend(
-                [
-                    line(
-                        x1=degree_x,
-                        y1=degree_y,
-                        x2=symbol_x,
-                        y2=symbol_y,
-                        stroke=self.config.theme[body.color],
-                        stroke_width=self.config.chart.stroke_width / 2,
-                    ),
-                    circle(
-                        cx=symbol_x,
-                        cy=symbol_y,
-                        r=self.font_size / 2,
-                        # fill="red",  # for testing only
-                        fill=self.config.theme.background,
-                    ),
-                    line(
-                        x1=degree_x,
-                        y1=degree_y,
-                        x2=inner_x,
-                        y2=inner_y,
-                        stroke=self.config.theme.dim,
-                        stroke_width=self.config.chart.stroke_width / 2,
-                        stroke_dasharray=self.ring_thickness / 11,
-                    ),
-                    g(
-                        svg_paths[body.name],
-                        transform=f"translate({symbol_x - self.pos_adjustment}, {symbol_y - self.pos_adjustment}) scale({self.scale_adjustment})",
-                        **g_opt,
-                    ),
-                ]
+            slot = 3 * i + 1
+            output[slot] = line(
+                x1=degree_x,
+                y1=degree_y,
+                x2=symbol_x,
+                y2=symbol_y,
+                stroke=body_color,
+                stroke_width=line_stroke_width,
             )
+            output[slot + 1] = circle(
+                cx=symbol_x,
+                cy=symbol_y,
+                r=symbol_bg_radius,
+                # fill="red",  # for testing only
+                fill=background,
+            )
+            output[slot + 2] = use(
+                href=symbol_refs[body.name],
+                transform=symbol_transform(
+                    symbol_x - pos_adj, symbol_y - pos_adj, scale_adj, precision
+                ),
+                **g_opt,
+            )
+            ticks[i] = line(x1=degree_x, y1=degree_y, x2=inner_x, y2=inner_y)
+
+        output[0] = g(ticks, stroke=dim, stroke_width=line_stroke_width, stroke_dasharray=dasharray)
         return output
 
     def aspect_lines(self, radius: float, aspects: list[Aspect]) -> list[str]:
@@ -524,37 +698,58 @@ class Chart(DotDict):
         Returns:
             A list of SVG elements representing aspect lines
         """
+        theme = self.config.theme
+        chart_config = self.config.chart
         bg = [
             self.background(
                 radius,
-                fill=self.config.theme.background,
-                stroke=self.config.theme.dim,
-                stroke_width=self.config.chart.stroke_width,
+                fill=theme.background,
+                stroke=theme.dim,
+                stroke_width=chart_config.stroke_width,
             )
         ]
-        aspect_lines = []
+        aspect_styles = self.aspect_styles
+        normalize = self.data1.normalize
+        stroke_width = chart_config.stroke_width / 2
+        stroke_opacity = chart_config.stroke_opacity
+        min_line_opacity = chart_config.min_line_opacity
+        # bodies take part in several aspects, project each degree only once
+        points: dict[float, tuple[float, float]] = {}
+
+        def point_of(degree: float) -> tuple[float, float]:
+            if degree not in points:
+                points[degree] = self.point(radius, unit_vector(normalize(degree)))
+            return points[degree]
+
+        # segments sharing a color and opacity level are drawn as one path
+        segments: dict[tuple[str, float], list[str]] = {}
+        lines_len = 0
         for aspect in aspects:
-            start_angle = radians(self.data1.normalize(aspect.body1.degree))
-            end_angle = radians(self.data1.normalize(aspect.body2.degree))
-            orb_config = self.config.orb[aspect.aspect_member.name]
+            name = aspect.aspect_member.name
+            color, orb_config = aspect_styles[name]
             if not orb_config:
                 continue
-            orb_fraction = 1 - aspect.orb / orb_config
-            opacity_factor = 1 if aspect.aspect_member.name == "conjunction" else orb_fraction
-            aspect_lines.append(
-                line(
-                    x1=self.cx - radius * cos(start_angle),
-                    y1=self.cy + radius * sin(start_angle),
-                    x2=self.cx - radius * cos(end_angle),
-                    y2=self.cy + radius * sin(end_angle),
-                    stroke=self.config.theme[aspect.aspect_member.color],
-                    stroke_width=self.config.chart.stroke_width / 2,
-                    stroke_opacity=self.config.chart.stroke_opacity * opacity_factor,
-                )
-            )
-
-        self.aspect_lines_len = len(aspect_lines)  # for test only
-        return bg + aspect_lines
+            opacity = stroke_opacity
+            if name != "conjunction":
+                opacity *= 1 - aspect.orb / orb_config
+            level = round(opacity * OPACITY_LEVELS) / OPACITY_LEVELS
+            # invisible lines only add weight to the svg
+            if opacity < min_line_opacity or not level:
+                continue
+            start_x, start_y = point_of(aspect.body1.degree)
+            end_x, end_y = point_of(aspect.body2.degree)
+            segments.setdefault((color, level), []).append(f"M{start_x} {start_y}L{end_x} {end_y}")
+            lines_len += 1
+
+        self.aspect_lines_len = lines_len  # for test only
+        if not segments:
+            return bg
+        aspect_paths = [
+            path("", d="".join(segs), stroke=color, stroke_opacity=level)
+            for (color, level), segs in segments.items()
+        ]
+        # the paths share their stroke width and fill through one group
+        return bg + [g(aspect_paths, stroke_width=stroke_width, fill="none")]
 
     @cached_property
     def house_vertices(self) -> list[tuple[float, float]]:
@@ -575,6 +770,78 @@ class Chart(DotDict):
 
         return vertices
 
+    @cached_property
+    def sign_trig(self) -> list[tuple[float, float]]:
+        """Cosine and sine of the starting angle of each sign.
+
+        Returns:
+            A list of (cos, sin) tuples, shared by all sign wheel sectors
+        """
+        offset = unit_vector(self.data1.signs[0].normalized_degree)
+        return [rotate(trig, offset) for trig in SIGN_TRIG]
+
+    @cached_property
+    def sign_center_trig(self) -> list[tuple[float, float]]:
+        """Cosine and sine of the center angle of each sign.
+
+        Returns:
+            A list of (cos, sin) tuples used to place the sign symbols
+        """
+        offset = unit_vector(self.data1.signs[0].normalized_degree)
+        return [rotate(trig, offset) for trig in SIGN_CENTER_TRIG]
+
+    @cached_property
+    def house_trig(self) -> list[tuple[float, float]]:
+        """Cosine and sine of each house cusp.
+
+        Returns:
+            A list of (cos, sin) tuples, shared by house sectors and vertex lines
+        """
+        return [unit_vector(house.normalized_degree) for house in self.data1.houses]
+
+    @cached_property
+    def house_mid_trig(self) -> list[tuple[float, float]]:
+        """Cosine and sine of the center angle of each house.
+
+        Returns:
+            A list of (cos, sin) tuples used to place the house numbers
+        """
+        return [
+            # house_vertices unwraps end_deg past start_deg, no modulo needed
+            unit_vector(start_deg + (end_deg - start_deg) / 2)
+            for start_deg, end_deg in self.house_vertices
+        ]
+
+    @cached_property
+    def aspect_styles(self) -> dict[str, tuple[str, float]]:
+        """Get the line color and orb setting of each aspect.
+
+        Returns:
+            A dict mapping aspect names to (color, orb) tuples
+        """
+        colors = self.theme_colors
+        orb = self.config.orb
+        return {member.name: (colors[member.color], orb[member.name]) for member in ASPECT_MEMBERS}
+
+    @cached_property
+    def theme_colors(self) -> dict[str, str]:
+        """Get the theme as a plain dict for repeated color lookups.
+
+        Returns:
+            A dict mapping theme color names to hex color strings
+        """
+        return dict(self.config.theme)
+
+    @cached_property
+    def sign_colors(self) -> list[str]:
+        """Get the theme color of each sign.
+
+        Returns:
+            A list of hex color strings, shared by sign symbols and house numbers
+        """
+        colors = self.theme_colors
+        return [colors[sign.color] for sign in SIGN_MEMBERS]
+
     @cached_property
     def bg_colors(self) -> list[str]:
         """Get the background colors for each house.
@@ -583,23 +850,23 @@ class Chart(DotDict):
             A list of hex color strings for house backgrounds
         """
 
-        def hex_to_rgb(hex_value):
-            hex_value = hex_value.lstrip("#")
-            return tuple(int(hex_value[i : i + 2], 16) for i in (0, 2, 4))
-
-        def rgb_to_hex(rgb):
-            return "#" + "".join(f"{i:02x}" for i in rgb)
+        def hex_to_rgb(hex_value: str) -> tuple[int, int, int]:
+            value = int(hex_value.lstrip("#")[:6], 16)
+            return value >> 16, (value >> 8) & 0xFF, value & 0xFF
 
-        trans = self.config.theme.transparency
+        theme = self.config.theme
+        trans = theme.transparency
+        bg_trans = 1 - trans
+        bg_r, bg_g, bg_b = hex_to_rgb(theme.background)
         output = []
-        for i in range(4):
-            hex_color = getattr(self.config.theme, SIGN_MEMBERS[i].color)
-            rgb_color = hex_to_rgb(hex_color)
-            rgb_bg = hex_to_rgb(self.config.theme.background)
-            # blend the color with the background
-            blended_rgb = tuple(
-                int(trans * rgb_color[i] + (1 - trans) * rgb_bg[i]) for i in range(3)
+        for sign_color in self.sign_colors[:4]:
+            red, green, blue = hex_to_rgb(sign_color)
+            # blend the color with the background, packed back into one integer
+            blended = (
+                int(trans * red + bg_trans * bg_r) << 16
+                | int(trans * green + bg_trans * bg_g) << 8
+                | int(trans * blue + bg_trans * bg_b)
             )
-            output.append(rgb_to_hex(blended_rgb))
+            output.append(f"#{blended:06x}")
 
         return output * 4
@@ -170,6 +170,8 @@ class ChartConfig(ModelDict):
     ring_thickness_fraction: the thickness of the sign and house rings, compared to the radius
     scale_adj_factor: the number divide the chart width, to create scale adjustment for symbols
     pos_adj_factor: the number divide the font size, to create position adjustment for symbols
+    min_line_opacity: aspect lines fainter than this opacity are not drawn
+    precision: decimal places of the chart coordinates, 0 for integers
     """
 
     stroke_width: int = 1
@@ -183,6 +185,8 @@ class ChartConfig(ModelDict):
     # hard-coded 2.2 and 600 due to the original symbol svg size = 20x20
     scale_adj_factor: float = 600
     pos_adj_factor: float = 2.2
+    min_line_opacity: float = 0.02
+    precision: int = Field(default=1, ge=0)
 
 
 class Config(ModelDict):
@@ -212,7 +216,17 @@ class Config(ModelDict):
             case "dark":
                 return self.dark_theme
             case "mono":
-                kwargs = {key: "#888888" for key in self.light_theme.model_dump()}
-                kwargs["background"] = "#FFFFFF"
-                kwargs["transparency"] = 0
-                return Theme(**kwargs)
+                return mono_theme()
+
+
+def mono_theme() -> Theme:
+    """
+    Monochrome theme colors.
+
+    Returns:
+        Theme: The monochrome theme colors.
+    """
+    kwargs = {key: "#888888" for key in Theme.model_fields}
+    kwargs["background"] = "#FFFFFF"
+    kwargs["transparency"] = 0
+    return Theme(**kwargs)
@@ -107,6 +107,8 @@ class Data(DotDict):
                 degree=floor(cusp * 100) / 100,
             )
             self.houses.append(house_body)
+        # sorted once here, house_of() is called for every body in rulers and stats
+        self.sorted_houses = sorted(self.houses, key=lambda x: x.degree, reverse=True)
 
         self.vertices = [
             Vertex(degree=asc_deg, **VERTEX_MEMBERS[0]),
@@ -216,11 +218,10 @@ class Data(DotDict):
 
     def house_of(self, body: Body) -> int:
         """Get the house number containing a celestial body"""
-        sorted_houses = sorted(self.houses, key=lambda x: x.degree, reverse=True)
-        for house in sorted_houses:
+        for house in self.sorted_houses:
             if body.degree >= house.degree:
                 return house.value
-        return sorted_houses[0].value
+        return self.sorted_houses[0].value
 
     def normalize(self, degree: float) -> float:
         """Normalize a degree relative to the Ascendant.
@@ -242,20 +243,24 @@ class Data(DotDict):
         Returns:
             List of aspects found between the bodies
         """
+        # orb windows of the enabled aspects, resolved once for all pairs
+        windows = []
+        for aspect_member in ASPECT_MEMBERS:
+            orb_val = self.config.orb[aspect_member.name]
+            if orb_val:
+                windows.append(
+                    (aspect_member, aspect_member.value - orb_val, aspect_member.value + orb_val)
+                )
+
         output = []
         for b1, b2 in body_pairs:
-            sorted_bodies = sorted([b1, b2], key=lambda x: x.degree)
-            org_angle = sorted_bodies[1].degree - sorted_bodies[0].degree
+            low, high = (b1, b2) if b1.degree <= b2.degree else (b2, b1)
+            org_angle = high.degree - low.degree
             # get the smaller angle
             angle = 360 - org_angle if org_angle > 180 else org_angle
-            for aspect_member in ASPECT_MEMBERS:
-                orb_val = self.config.orb[aspect_member.name]
-                if not orb_val:
-                    continue
-                max_orb = aspect_member.value + orb_val
-                min_orb = aspect_member.value - orb_val
+            for aspect_member, min_orb, max_orb in windows:
                 if min_orb <= angle <= max_orb:
-                    applying = sorted_bodies[0].speed > sorted_bodies[1].speed
+                    applying = low.speed > high.speed
                     if angle < aspect_member.value:
                         applying = not applying
                     applying = not applying if org_angle > 180 else applying
@@ -1,12 +1,16 @@
 """utility functions for natal"""
 
 from datetime import datetime, timezone
+from functools import cache
+from importlib.resources import files
 from natal.classes import Aspectable
 from natal.config import Config
-from pathlib import Path
 from tagit import svg
 from typing import Iterable
 
+# resolved through the package loader, so it also works for zipped installs
+svg_folder = files("natal") / "svg_paths"
+
 
 def color_hex(name: str, config: Config = Config()) -> str:
     """Get color hex code from name and config.
@@ -125,6 +129,13 @@ symbol_to_svg_filename = {
 }
 
 
+@cache
+def svg_path_data(name: str) -> str:
+    """read the inner SVG markup of a symbol once, joined into a single line"""
+    lines = (svg_folder / f"{name}.svg").read_text().splitlines()
+    return "".join(line.strip() for line in lines)
+
+
 def svg_tag(name: str, scale: float = 0.5, color: str = "#595959") -> str:
     """generates an SVG tag of a given symbol name"""
     if not name:
@@ -136,7 +147,7 @@ def svg_tag(name: str, scale: float = 0.5, color: str = "#595959") -> str:
         fill = color
 
     return svg(
-        (Path(__file__).parent / "svg_paths" / f"{name}.svg").read_text(),
+        svg_path_data(name),
         fill=fill,
         stroke=stroke,
         stroke_width=3 * scale,
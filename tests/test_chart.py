@@ -3,7 +3,8 @@ from natal.chart import Chart
 from natal.data import Data
 from tests import data1, data2
 from math import floor
-from natal.config import Display, Config, Orb
+from natal.config import ChartConfig, Display, Config, Orb
+import re
 
 
 @fixture(scope="module")
@@ -119,5 +120,67 @@ def test_fix_orb_eq_0(data1: Data) -> None:
     chart = Chart(data1=data, width=600)
     _ = org_chart.svg
     _ = chart.svg
-    assert chart.aspect_lines_len == 11
-    assert org_chart.aspect_lines_len == 18
+    assert chart.aspect_lines_len == 10
+    assert org_chart.aspect_lines_len == 17
+
+
+def test_svg_cached(data1: Data) -> None:
+    chart = Chart(data1=data1, width=600)
+    assert chart.svg is chart.svg
+
+
+def test_symbol_defs(chart: Chart) -> None:
+    svg = chart.svg
+    assert svg.count('id="sym_sun"') == 1
+    assert svg.count('href="#sym_sun"') == 2
+    assert svg.count('href="#sym_aries"') == 1
+
+
+def test_merged_aspect_paths(data1: Data) -> None:
+    chart = Chart(data1=data1, width=600)
+    tags = re.findall(r"<(path|line)\b([^>]*)>", chart.svg)
+    # aspect paths take their fill from the shared group, sectors set their own
+    aspect_paths = [
+        attrs
+        for tag, attrs in tags
+        if tag == "path" and "stroke-opacity" in attrs and "fill=" not in attrs
+    ]
+    assert len(aspect_paths) < chart.aspect_lines_len
+    segments = sum(len(re.findall(r"M[^ML]+L", attrs)) for attrs in aspect_paths)
+    assert segments == chart.aspect_lines_len
+    styles = [
+        (re.search(r'stroke="([^"]*)"', attrs)[1], re.search(r'stroke-opacity="([^"]*)"', attrs)[1])
+        for attrs in aspect_paths
+    ]
+    assert len(set(styles)) == len(styles)
+    # only the 12 house cusp lines keep a per-element opacity
+    assert sum(tag == "line" and "stroke-opacity" in attrs for tag, attrs in tags) == 12
+
+
+def test_adjusted_degrees_well_spaced(chart: Chart) -> None:
+    degs = [10.5, 40, 100, 200, 355]
+    assert chart.adjusted_degrees(degs, 10) == degs
+    assert chart.adjusted_degrees([], 10) == []
+
+
+def test_min_line_opacity(data1: Data) -> None:
+    config = Config(chart=ChartConfig(min_line_opacity=1))
+    data = Data(data1.name, data1.lat, data1.lon, data1.utc_dt, config=config)
+    chart = Chart(data1=data, width=600)
+    _ = chart.svg
+    conjunctions = [a for a in data.aspects if a.aspect_member.name == "conjunction"]
+    assert chart.aspect_lines_len == len(conjunctions)
+
+
+def test_no_zero_opacity_lines(data1: Data) -> None:
+    config = Config(chart=ChartConfig(min_line_opacity=0))
+    data = Data(data1.name, data1.lat, data1.lon, data1.utc_dt, config=config)
+    chart = Chart(data1=data, width=600)
+    assert 'stroke-opacity="0.0"' not in chart.svg
+    assert chart.aspect_lines_len == 17
+
+
+def test_precision(data1: Data) -> None:
+    config = Config(chart=ChartConfig(precision=0))
+    data = Data(data1.name, data1.lat, data1.lon, data1.utc_dt, config=config)
+    assert 'd="M300 300L' in Chart(data1=data, width=600).svg
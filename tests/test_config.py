@@ -1,5 +1,6 @@
-from natal.config import Config, DotDict, Orb
-from pytest import fixture
+from natal.config import ChartConfig, Config, DotDict, Orb
+from pydantic import ValidationError
+from pytest import fixture, raises
 
 
 class Foo(DotDict):
@@ -46,6 +47,7 @@ def test_mono_theme() -> None:
     assert cfg.theme.foreground == cfg.theme.fire
     assert cfg.theme.background == "#FFFFFF"
     assert cfg.theme.transparency == 0
+    assert cfg == Config(theme_type="mono")
 
 
 def test_dot_notation(foo):
@@ -72,3 +74,8 @@ def test_model_dict_iter():
     # iter of original pydantic model returns key value pairs, not keys
     orb_keys = [key for key in Orb()]
     assert orb_keys == ["conjunction", "opposition", "trine", "square", "sextile", "quincunx"]
+
+
+def test_negative_precision():
+    with raises(ValidationError):
+        ChartConfig(precision=-1)